@@ -0,0 +1,137 @@
+"""
+Startup benchmark for the worker.
+
+Measures, in fresh interpreters, the time to import the worker package and
+the time from importing the worker to the end of its first ``run()``.
+``requests.get`` is mocked, so the measured first run still pays for importing
+the parser dependencies but makes no network calls.
+
+With ``--baseline REF`` the same measurements are taken for the tree at git
+revision REF, so that cold-start times before and after a change can be
+compared. Source selection is not measured for the baseline, because older
+trees may not support the ``sources`` setting.
+
+Usage::
+
+    python benchmarks/bench_startup.py [--repeat N] [--baseline REF]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# fixtures are always taken from this tree, the baseline may not have them
+TEST_DATA_PATH = os.path.join(ROOT, 'tests', 'test_data.py')
+
+IMPORT_SCRIPT = """
+import time
+start = time.perf_counter()
+import tfw_myworker
+print(time.perf_counter() - start)
+"""
+
+FIRST_RUN_SCRIPT = """
+import importlib.util
+import time
+from unittest.mock import patch
+spec = importlib.util.spec_from_file_location('bench_test_data', {data_path!r})
+data = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(data)
+start = time.perf_counter()
+from tf_workers import get_worker
+Worker = get_worker('myworker')
+worker_obj = Worker(
+    number_of_pates_gists=3,
+    match_patterns=['import', 'def'],
+    github_username='',
+    github_password='',
+    pastebin_username='',
+    pastebin_password='',
+    {sources}
+)
+with patch('requests.get', side_effect=data.fake_requests_get):
+    worker_obj.run()
+print(time.perf_counter() - start)
+"""
+
+# None runs the worker without the 'sources' setting, i.e. with all sources
+SOURCE_SETS = [None, ['github'], ['pastebin']]
+
+
+def measure(script, repeat, cwd):
+    """Run script in fresh interpreters and collect printed timings.
+
+    :param script: python code printing elapsed seconds as last line
+    :param repeat: number of interpreter runs
+    :param cwd: root of the tree to measure
+    :return: list of timings in seconds
+    """
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, '-c', script], cwd=cwd, universal_newlines=True)
+        timings.append(float(output.strip().splitlines()[-1]))
+    return timings
+
+
+def report(label, timings):
+    """Print median and min of timings in milliseconds."""
+    print('{:<40} median {:8.2f} ms   min {:8.2f} ms'.format(
+        label, statistics.median(timings) * 1000, min(timings) * 1000))
+
+
+def first_run_script(sources):
+    """Return first run script for given sources.
+
+    :param sources: list of source names, None for the worker default
+    :return: python code
+    """
+    return FIRST_RUN_SCRIPT.format(data_path=TEST_DATA_PATH,
+                                   sources='' if sources is None else 'sources={!r},'.format(sources))
+
+
+def bench_tree(label, cwd, repeat, source_sets):
+    """Measure import and first run times of one tree.
+
+    :param label: tree name for report
+    :param cwd: root of the tree to measure
+    :param repeat: number of interpreter runs per measurement
+    :param source_sets: source lists to measure first run with
+    """
+    report('{}: import tfw_myworker'.format(label), measure(IMPORT_SCRIPT, repeat, cwd))
+    for sources in source_sets:
+        name = 'all' if sources is None else ','.join(sources)
+        report('{}: first run {}'.format(label, name), measure(first_run_script(sources), repeat, cwd))
+
+
+def export_tree(ref, path):
+    """Extract files of git revision into directory.
+
+    :param ref: git revision
+    :param path: target directory
+    """
+    archive = os.path.join(path, 'tree.tar')
+    subprocess.check_call(['git', 'archive', '--format=tar', '-o', archive, ref], cwd=ROOT)
+    with tarfile.open(archive) as tar:
+        tar.extractall(path)
+    os.remove(archive)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=10, help='interpreter runs per measurement')
+    parser.add_argument('--baseline', metavar='REF', help='git revision to compare against')
+    args = parser.parse_args()
+
+    if args.baseline:
+        with tempfile.TemporaryDirectory() as path:
+            export_tree(args.baseline, path)
+            bench_tree(args.baseline, path, args.repeat, [None])
+    bench_tree('current', ROOT, args.repeat, SOURCE_SETS)
+
+
+if __name__ == '__main__':
+    main()
@@ -121,3 +121,19 @@ GITHUB_ONE_POST_IN_LIST_RESPONSE = [
      'files': {'example.js': {'raw_url': 'https://gist.githubusercontent.com/philipkueng/99f98a7346faa9e86a4e3e34778eccb8/raw/51d069b218b1cdc80f726992ac1ce3866f9d60ae/example.js',}}
      }
 ]
+
+
+def fake_requests_get(url, params=None, **kwargs):
+    """Stand-in for requests.get returning the responses above by url."""
+    from unittest.mock import Mock
+
+    response = Mock()
+    if url.endswith('/gists/public'):
+        response.json.return_value = GITHUB_POST_LIST_RESPONSE
+    elif '/gists/' in url:
+        response.json.return_value = {'files': GITHUB_POST_RESPONSE}
+    elif url.endswith('/archive'):
+        response.text = PASTEBIN_POST_LIST_RESPONSE
+    else:
+        response.text = PASTEBIN_POST_RESPONSE
+    return response
@@ -1,12 +1,28 @@
+import os
+import subprocess
+import sys
 import unittest
 from unittest.mock import patch
 
 from tf_workers import get_worker
 
 from tests import test_data as data
-from tfw_myworker.exceptions import AuthenticationException
+from tfw_myworker.exceptions import AuthenticationException, UnknownSourceException
 from tfw_myworker.parsers import GitHubParser
 from tfw_myworker.parsers import PasteBinParser
+from tfw_myworker import sources
+from tfw_myworker.sources import available_sources, declare_source, get_source, register_source
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# prints modules which tfw_myworker loads on top of tf_workers
+NEW_MODULES_SCRIPT = """
+import sys
+import tf_workers
+before = set(sys.modules)
+{}
+print(' '.join(set(sys.modules) - before))
+"""
 
 
 class TestParsersResponse(unittest.TestCase):
@@ -89,3 +105,58 @@ class TestParsersResponse(unittest.TestCase):
             mock_github_post.return_value = data.GITHUB_POST_RESPONSE
             resp = worker_obj.run()
             self.assertEqual(len(resp.data), 5)
+
+
+class TestSources(unittest.TestCase):
+    """Test cases for source registry."""
+
+    def test_get_source(self):
+        self.assertIs(get_source('github'), GitHubParser)
+        self.assertIs(get_source('pastebin'), PasteBinParser)
+
+    def test_get_unknown_source(self):
+        with self.assertRaises(UnknownSourceException):
+            get_source('unknown')
+
+    def test_declare_source(self):
+        class DummyParser:
+            settings_prefix = None
+
+        def import_module(module):
+            register_source('dummy')(DummyParser)
+
+        with patch.dict(sources.SOURCE_MODULES), patch.dict(sources._registry), \
+                patch('tfw_myworker.sources.importlib.import_module', side_effect=import_module) as mock_import:
+            declare_source('dummy', 'tests.dummy_source')
+            self.assertIn('dummy', available_sources())
+            mock_import.assert_not_called()
+            self.assertIs(get_source('dummy'), DummyParser)
+            mock_import.assert_called_once_with('tests.dummy_source')
+            self.assertEqual(DummyParser.source_name, 'dummy')
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test cases for deferred import of parser dependencies."""
+
+    def _get_new_modules(self, code):
+        script = NEW_MODULES_SCRIPT.format(code)
+        output = subprocess.check_output([sys.executable, '-c', script], cwd=ROOT, universal_newlines=True)
+        return set(output.split())
+
+    def test_import_does_not_load_dependencies(self):
+        modules = self._get_new_modules('import tfw_myworker')
+        self.assertNotIn('requests', modules)
+        self.assertNotIn('lxml', modules)
+
+    def test_github_run_does_not_load_lxml(self):
+        modules = self._get_new_modules(
+            "from unittest.mock import patch\n"
+            "from tests import test_data as data\n"
+            "from tf_workers import get_worker\n"
+            "worker_obj = get_worker('myworker')(number_of_pates_gists=3, match_patterns=['def'],\n"
+            "                                    sources=['github'], github_username='', github_password='',\n"
+            "                                    pastebin_username='', pastebin_password='')\n"
+            "with patch('requests.get', side_effect=data.fake_requests_get):\n"
+            "    assert worker_obj.run().data\n"
+        )
+        self.assertNotIn('lxml', modules)
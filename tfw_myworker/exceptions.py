@@ -5,4 +5,9 @@ class AuthenticationException(Exception):
 class NotAvailableException(Exception):
     """Server is not available"""
 
-    pass
\ No newline at end of file
+    pass
+
+class UnknownSourceException(Exception):
+    """Source is not registered"""
+
+    pass
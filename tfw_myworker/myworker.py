@@ -9,12 +9,8 @@ import logging
 from tf_workers import (  # pylint: disable=E0611
     Worker, SettingProperty, WorkerResponse, ResponseCodes as RC
 )
-from tf_workers.config import ApplicationConfig  # pylint: disable=E
 
-from tfw_myworker.parsers import GitHubParser
-from tfw_myworker.parsers import PasteBinParser
-
-config = ApplicationConfig.get_config()
+from tfw_myworker.sources import available_sources, get_source
 
 log = logging.getLogger(__name__)
 
@@ -50,6 +46,10 @@ class MyWorker(Worker):
             name='match_patterns', data_type=list,
             description='match_patterns'))
 
+        self.settings.add(SettingProperty(
+            name='sources', data_type=list,
+            description='sources to search, all known sources if empty'))
+
         self.settings.add(SettingProperty(
             name='github_username', data_type=str,
             description='github_username'))
@@ -82,6 +82,25 @@ class MyWorker(Worker):
                 expressions[expr] = pattern
         return expressions
 
+    def _get_parsers(self, match_patterns):
+        """Create parsers for enabled sources.
+
+        :param match_patterns: compiled regular expressions for find
+        :return: list of parsers
+        """
+        parsers = []
+        for name in self.settings.sources.value or available_sources():
+            parser_class = get_source(name)
+            username = password = None
+            if parser_class.settings_prefix:
+                username = getattr(self.settings, '{}_username'.format(parser_class.settings_prefix)).value
+                password = getattr(self.settings, '{}_password'.format(parser_class.settings_prefix)).value
+            parsers.append(parser_class(posts_number=self.settings.number_of_pates_gists.value,
+                                        match_patterns=match_patterns,
+                                        username=username,
+                                        password=password,))
+        return parsers
+
     def __init__(self, **kwargs):
         """Create worker object."""
         super().__init__(kwargs)
@@ -92,15 +111,7 @@ class MyWorker(Worker):
         self.response = WorkerResponse()
         self.response.response_code = RC.SUCCESS
         match_patterns = self._check_and_get_match_patterns()
-        github_parser = GitHubParser(posts_number=self.settings.number_of_pates_gists.value,
-                              match_patterns=match_patterns,
-                              username=self.settings.github_username.value,
-                              password=self.settings.github_password.value,)
-        pastebin_parser = PasteBinParser(posts_number=self.settings.number_of_pates_gists.value,
-                                match_patterns=match_patterns,
-                                username=self.settings.pastebin_username.value,
-                                password=self.settings.pastebin_password.value,)
-        parsers = [github_parser, pastebin_parser]
+        parsers = self._get_parsers(match_patterns)
         data = []
         for parser in parsers:
             data.extend(parser.parse())
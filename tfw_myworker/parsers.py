@@ -1,15 +1,14 @@
 """
 Module for searching github and pastebin posts by regular expressions.
+
+``requests`` and ``lxml`` are imported on first use, so that importing this
+module stays cheap for short-lived workers.
 """
 import logging
-
-import requests
-from lxml import html
-from requests.auth import HTTPBasicAuth
-from requests.compat import urljoin
-from requests.exceptions import ConnectionError
+from urllib.parse import urljoin
 
 from tfw_myworker.exceptions import AuthenticationException, NotAvailableException
+from tfw_myworker.sources import register_source
 
 log = logging.getLogger(__name__)
 
@@ -22,6 +21,9 @@ class BaseParser:
     BASE_URL = 'https://api.github.com'  # as only an example
     POST_URL = '/gists/'  # as only an example
     POST_LIST_URL = '/gists/public'   # as only an example
+    # worker settings '<prefix>_username' and '<prefix>_password' hold credentials,
+    # None if the source does not need them
+    settings_prefix = None
     headers = {
         "Accept": "*/*",
         "Accept-Encoding": "gzip, deflate, br",
@@ -47,7 +49,10 @@ class BaseParser:
 
         self.posts_number = posts_number
         self.match_patterns = match_patterns
-        self.auth = HTTPBasicAuth(username, password) if username and password else None
+        self.auth = None
+        if username and password:
+            from requests.auth import HTTPBasicAuth
+            self.auth = HTTPBasicAuth(username, password)
 
     def _get_post_list_url(self):
         """Get url for post list.
@@ -74,9 +79,11 @@ class BaseParser:
         :param to_json: is response a json
         :return: request response
         """
+        import requests
+
         try:
             response = requests.get(url, params=params, headers=self.headers, auth=self.auth)
-        except ConnectionError:
+        except requests.exceptions.ConnectionError:
             log.critical('Service unavailable')
             raise NotAvailableException('Service unavailable')
 
@@ -125,12 +132,14 @@ class BaseParser:
             })
 
 
+@register_source('github')
 class GitHubParser(BaseParser):
     """Parser for github pages."""
     BASE_URL = 'https://api.github.com'
     POST_URL = '/gists/'
     POST_LIST_URL = '/gists/public'
     COUNT_POSTS_MAX = 100
+    settings_prefix = 'github'
 
     def _get_files_content_page(self, item_id):
         """Get data files from post page.
@@ -224,12 +233,14 @@ class GitHubParser(BaseParser):
         return new_response
 
 
+@register_source('pastebin')
 class PasteBinParser(BaseParser):
     """Parser for working with pastebin."""
     BASE_URL = 'https://pastebin.com'
     POST_URL = '/raw'
     POST_LIST_URL = '/archive'
     COUNT_POSTS_MAX = 50
+    settings_prefix = 'pastebin'
 
     def _get_pastes_page_content(self):
         """Get content of page with posts.
@@ -255,6 +266,8 @@ class PasteBinParser(BaseParser):
 
         :return: list of parsed object with link and description
         """
+        from lxml import html
+
         count_posts = self.posts_number if 0 < self.posts_number < self.COUNT_POSTS_MAX else self.COUNT_POSTS_MAX
         pastes_page_content = self._get_pastes_page_content()
         tree = html.fromstring(pastes_page_content)
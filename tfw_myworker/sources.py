@@ -0,0 +1,64 @@
+"""
+Registry of post sources.
+
+Parsers register themselves by name with :func:`register_source`. Each source
+name is declared once in ``SOURCE_MODULES`` (or with :func:`declare_source`)
+together with the module that registers it, and that module is imported only
+when the source is first requested. Heavy dependencies of a parser should be
+imported inside the methods that use them.
+"""
+import importlib
+
+from tfw_myworker.exceptions import UnknownSourceException
+
+# source name -> module that registers it when imported
+SOURCE_MODULES = {
+    'github': 'tfw_myworker.parsers',
+    'pastebin': 'tfw_myworker.parsers',
+}
+
+_registry = {}
+
+
+def declare_source(name, module):
+    """Declare module which registers a source, without importing it.
+
+    :param name: source name used in the ``sources`` worker setting
+    :param module: dotted path of module to import on first use of source
+    """
+    SOURCE_MODULES[name] = module
+
+
+def register_source(name):
+    """Register parser class as a source with given name.
+
+    :param name: source name used in the ``sources`` worker setting
+    :return: class decorator
+    """
+    def decorator(parser_class):
+        parser_class.source_name = name
+        _registry[name] = parser_class
+        return parser_class
+    return decorator
+
+
+def get_source(name):
+    """Return parser class for source, importing its module on first use.
+
+    :param name: source name
+    :return: parser class
+    """
+    if name not in _registry and name in SOURCE_MODULES:
+        importlib.import_module(SOURCE_MODULES[name])
+    try:
+        return _registry[name]
+    except KeyError:
+        raise UnknownSourceException('Unknown source: {}'.format(name))
+
+
+def available_sources():
+    """Return names of all known sources without importing them.
+
+    :return: sorted list of source names
+    """
+    return sorted(set(SOURCE_MODULES) | set(_registry))